@@ -5,32 +5,405 @@ designed to be flexible and extensible.
 """
 
 from __future__ import annotations
+import asyncio
+import collections.abc
+import concurrent.futures
+import contextlib
+import contextvars
+import functools
+import os
 import pydantic
+from pydantic.functional_validators import ModelWrapValidatorHandler
+from pydantic_core import core_schema
 import warnings
-from typing import Any
+from typing import Any, Callable, Iterator, TypeVar
 import pathlib
+import re
+import sys
+import types
+import typing
+import weakref
 from typing_extensions import Self
-import json
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+TRUSTED_LOAD = False
+"""If True, objects referenced by file path are built with `model_construct` instead of being validated.
+
+Only enable this for canon files that are known to be valid, e.g. files that were produced by this library.
+"""
+
+_PATH_CACHE: weakref.WeakValueDictionary[tuple[str, int, int, bool], Any] = (
+    weakref.WeakValueDictionary()
+)
+"""Objects loaded from file paths, keyed by resolved path, modification time, size, and whether the load was trusted.
+
+The size guards against edits that keep the modification time on filesystems with coarse timestamps.
+"""
+
+_PREFETCHED: contextvars.ContextVar[dict[pathlib.Path, Any] | None] = (
+    contextvars.ContextVar("_PREFETCHED", default=None)
+)
+"""Documents read ahead of time by `FilePathReferencable.load_async`, keyed by resolved path."""
+
+_DIAGNOSTICS: contextvars.ContextVar[list[str] | None] = contextvars.ContextVar(
+    "_DIAGNOSTICS", default=None
+)
+"""The list that `collect_diagnostics` collects footnote diagnostics into, if it is active."""
+
+_COLLECTION_CACHE: contextvars.ContextVar[
+    dict[tuple[str, int, int, bool], Any] | None
+] = contextvars.ContextVar("_COLLECTION_CACHE", default=None)
+"""Objects loaded while `collect_diagnostics` is active, used for lookups in place of `_PATH_CACHE`.
+
+Objects cached before the collection started are loaded again, so that their diagnostics are reported.
+"""
+
+_FOOTNOTE_RE = re.compile(r"\[\^([^\[\]]+)\]")
+"""Matches a footnote reference such as [^1] in verse text, capturing the footnote label."""
+
+_UNION_TYPES = (typing.Union, getattr(types, "UnionType", typing.Union))
+
+
+def _nested_model(
+    annotation: Any,
+) -> tuple[str | None, type[pydantic.BaseModel]] | None:
+    """Find the Pydantic model held by a field annotation.
+
+    Returns a tuple of the container kind (None for a bare model, "dict" for dictionary values, "keyed" for `KeyedList`
+    values, "lazy" for `VersesDict` values, or "list" for list items) and the model class, or None if the annotation
+    does not hold a model.
+    """
+    origin = typing.get_origin(annotation)
+    if origin in _UNION_TYPES:
+        for arg in typing.get_args(annotation):
+            nested = _nested_model(arg)
+            if nested is not None:
+                return nested
+        return None
+    if origin is dict:
+        value_type = typing.get_args(annotation)[1]
+        if isinstance(value_type, type) and issubclass(value_type, pydantic.BaseModel):
+            return "dict", value_type
+        return None
+    if origin is KeyedList:
+        (value_type,) = typing.get_args(annotation)
+        if isinstance(value_type, type) and issubclass(value_type, pydantic.BaseModel):
+            return "keyed", value_type
+        return None
+    if origin is list:
+        (item_type,) = typing.get_args(annotation)
+        if isinstance(item_type, type) and issubclass(item_type, pydantic.BaseModel):
+            return "list", item_type
+        return None
+    if annotation is VersesDict:
+        return "lazy", Verse
+    if isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel):
+        return None, annotation
+    return None
+
+
+@contextlib.contextmanager
+def collect_diagnostics() -> Iterator[list[str]]:
+    """Collect footnote diagnostics into a list instead of emitting a warning for each one.
+
+    Within the context, `verify_verse` appends its messages to the yielded list, which is useful when validating many
+    files at once and reporting the problems together. Files loaded before the context was entered are loaded again
+    rather than taken from the cache, so that every problem is reported.
+    """
+    diagnostics: list[str] = []
+    token = _DIAGNOSTICS.set(diagnostics)
+    cache_token = _COLLECTION_CACHE.set({})
+    try:
+        yield diagnostics
+    finally:
+        _COLLECTION_CACHE.reset(cache_token)
+        _DIAGNOSTICS.reset(token)
+
+
+def _intern_keys(mapping: dict[str, Any]) -> None:
+    """Intern the keys of a dictionary in place so that keys repeated across dictionaries share a single object."""
+    items = [(sys.intern(key), value) for key, value in mapping.items()]
+    mapping.clear()
+    mapping.update(items)
+
+
+def _read_json(path: pathlib.Path) -> Any:
+    """Read and parse a JSON file, using orjson if it is installed."""
+    return _json_loads(path.read_bytes())
+
+
+def _load_json(path: pathlib.Path) -> Any:
+    """Load a JSON file, using the document read ahead of time by `load_async` if there is one."""
+    documents = _PREFETCHED.get()
+    data = None if documents is None else documents.get(path)
+    return _read_json(path) if data is None else data
+
+
+def _natural_key(path: str) -> list[Any]:
+    """Sort key for file paths that orders embedded numbers numerically, e.g. "2.json" before "10.json"."""
+    return [
+        int(part) if part.isdigit() else part
+        for part in re.split(r"(\d+)", os.path.basename(path))
+    ]
+
+
+_Model = TypeVar("_Model", bound=pydantic.BaseModel)
+
+
+def _cache_key(path: pathlib.Path, trusted: bool) -> tuple[str, int, int, bool]:
+    """Get the cache key of an object loaded from a resolved file path."""
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size, trusted
+
+
+def _cached(model: type[_Model], key: tuple[str, int, int, bool]) -> _Model | None:
+    """Get the cached object for a cache key, or None if there is no cached instance of `model`."""
+    collection_cache = _COLLECTION_CACHE.get()
+    cached = (_PATH_CACHE if collection_cache is None else collection_cache).get(key)
+    return cached if isinstance(cached, model) else None
+
+
+def _load_path(
+    model: type[_Model],
+    path: str | pathlib.Path,
+    trusted: bool,
+    build: Callable[[pathlib.Path], _Model],
+) -> _Model:
+    """Load an object from a file path, returning the cached object if the file was already loaded and is unchanged."""
+    path = pathlib.Path(path).resolve()
+    key = _cache_key(path, trusted)
+    cached = _cached(model, key)
+    if cached is not None:
+        return cached
+    instance = build(path)
+    _PATH_CACHE[key] = instance
+    collection_cache = _COLLECTION_CACHE.get()
+    if collection_cache is not None:
+        collection_cache[key] = instance
+    return instance
+
+
+@functools.lru_cache(maxsize=32)
+def _nested_fields(
+    model: type[pydantic.BaseModel],
+) -> tuple[tuple[str, str | None, type[pydantic.BaseModel]], ...]:
+    """List the fields of `model` that hold Pydantic models as (field name, container kind, model class) tuples."""
+    nested_fields = []
+    for name, field in model.model_fields.items():
+        nested = _nested_model(field.annotation)
+        if nested is not None:
+            nested_fields.append((name, *nested))
+    return tuple(nested_fields)
+
+
+def _references(
+    model: type[pydantic.BaseModel], data: Any
+) -> Iterator[tuple[type[FilePathReferencable], Any]]:
+    """Find the file path references in the data of a model, including those in nested objects given inline."""
+    if isinstance(data, (str, pathlib.Path)):
+        if issubclass(model, FilePathReferencable):
+            yield model, data
+        return
+    if not isinstance(data, dict):
+        return
+    for name, kind, nested_model in _nested_fields(model):
+        value = data.get(name)
+        if kind is None:
+            yield from _references(nested_model, value)
+        elif kind in ("dict", "keyed") and isinstance(value, dict):
+            for item in value.values():
+                yield from _references(nested_model, item)
+        elif kind == "list" and isinstance(value, list):
+            for item in value:
+                yield from _references(nested_model, item)
+
+
+async def _prefetch(
+    model: type[pydantic.BaseModel], path: Any, documents: dict[pathlib.Path, Any]
+) -> None:
+    """Read a file and every file it references, reading sibling references concurrently.
+
+    Files whose objects are already cached are skipped, along with the files they reference.
+    """
+    path = pathlib.Path(path).resolve()
+    if path in documents or _cached(model, _cache_key(path, TRUSTED_LOAD)) is not None:
+        return
+    documents[path] = None
+    data = documents[path] = await asyncio.to_thread(_read_json, path)
+    await asyncio.gather(
+        *(
+            _prefetch(nested_model, ref, documents)
+            for nested_model, ref in _references(model, data)
+        )
+    )
+
+
+def _construct(model: type[pydantic.BaseModel], data: Any) -> Any:
+    """Build an instance of `model` from trusted data without validation, recursing into nested models."""
+    if isinstance(data, model):
+        return data
+    if isinstance(data, (str, pathlib.Path)) and issubclass(
+        model, FilePathReferencable
+    ):
+        return _load_path(model, data, True, model.from_trusted_path)
+    values = dict(data)
+    for name, kind, nested_model in _nested_fields(model):
+        value = values.get(name)
+        if value is None:
+            continue
+        if kind is None:
+            values[name] = _construct(nested_model, value)
+        elif kind == "dict":
+            values[name] = {
+                key: _construct(nested_model, item) for key, item in value.items()
+            }
+        elif kind == "keyed":
+            values[name] = KeyedList(
+                {key: _construct(nested_model, item) for key, item in value.items()}
+            )
+        elif kind == "lazy":
+            values[name] = VersesDict(value)
+        else:
+            values[name] = [_construct(nested_model, item) for item in value]
+    return model.model_construct(**values)
+
+
+def _mapping_schema(
+    cls: Callable[[dict[str, Any]], Any],
+    value_type: Any,
+    handler: pydantic.GetCoreSchemaHandler,
+) -> core_schema.CoreSchema:
+    """Build the core schema of a read-only mapping type that is validated from and serialized to a JSON object."""
+    dict_schema = handler.generate_schema(dict[str, value_type])
+    return core_schema.no_info_after_validator_function(
+        cls,
+        dict_schema,
+        # A wrap serializer hands the dict to the dict schema's own serializer, which applies nested include/exclude.
+        serialization=core_schema.wrap_serializer_function_ser_schema(
+            lambda value, serialize: serialize(dict(value.items())), schema=dict_schema
+        ),
+    )
+
+
+_T = TypeVar("_T")
+
+
+class KeyedList(collections.abc.Mapping[str, _T]):
+    """An immutable, ordered mapping stored as a tuple of keys and a tuple of values.
+
+    This is more compact than a `dict` for the small, ordered collections of the schema, such as the chapters of a book,
+    and iterating over it walks a tuple. The index used to look up a value by key is only built on the first lookup.
+    In a model, it is validated from and serialized to a JSON object, just like a `dict`.
+    """
+
+    __slots__ = ("_keys", "_values", "_index")
+
+    def __init__(self, items: collections.abc.Mapping[str, _T] | None = None) -> None:
+        items = {} if items is None else items
+        self._keys: tuple[str, ...] = tuple(items.keys())
+        self._values: tuple[_T, ...] = tuple(items.values())
+        self._index: dict[str, int] | None = None
+
+    def __getitem__(self, key: str) -> _T:
+        if self._index is None:
+            self._index = {k: index for index, k in enumerate(self._keys)}
+        return self._values[self._index[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def values(self) -> collections.abc.ValuesView[_T]:
+        return _KeyedListValuesView(self)
+
+    def items(self) -> collections.abc.ItemsView[str, _T]:
+        return _KeyedListItemsView(self)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: pydantic.GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        args = typing.get_args(source)
+        return _mapping_schema(cls, args[0] if args else Any, handler)
+
+
+class _KeyedListValuesView(collections.abc.ValuesView):
+    """A values view of a `KeyedList` that iterates over its values without building the key index."""
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._mapping._values)
+
+
+class _KeyedListItemsView(collections.abc.ItemsView):
+    """An items view of a `KeyedList` that iterates over its keys and values without building the key index."""
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        return zip(self._mapping._keys, self._mapping._values)
 
 
 class FilePathReferencable(pydantic.BaseModel):
     """An object that can be referenced by a file path."""
 
-    @pydantic.model_validator(mode="before")
+    # Objects loaded from file paths are shared between references, so they must never be copied or revalidated.
+    model_config = pydantic.ConfigDict(revalidate_instances="never", defer_build=True)
+
+    @pydantic.model_validator(mode="wrap")
     @classmethod
-    def validate_id(cls, data: Any) -> Any:
+    def validate_id(cls, data: Any, handler: ModelWrapValidatorHandler[Self]) -> Self:
         """If the object is a file path, load the object from the file path, cache the object, and return the object."""
 
+        if isinstance(data, cls):
+            return data
         if isinstance(data, (str, pathlib.Path)):
-            data = json.loads(pathlib.Path(data).read_text(encoding="utf-8"))
-            # TODO: Add a model validator that caches the object so that multiple references to the same file path return the
-            # same object.
-        return data
+            if TRUSTED_LOAD:
+                return _load_path(cls, data, True, cls.from_trusted_path)
+            return _load_path(cls, data, False, lambda path: handler(_load_json(path)))
+        return handler(data)
+
+    @classmethod
+    async def load_async(cls, path: str | pathlib.Path) -> Self:
+        """Load the object from a file path, reading the files it references concurrently.
+
+        All referenced files that are not already cached are read on worker threads before the object is built, which
+        overlaps disk latency when they are not yet in the OS cache. The object is then built on a worker thread, so the
+        event loop is not blocked, exactly as `model_validate` would build it, including caching and `TRUSTED_LOAD`.
+        """
+        documents: dict[pathlib.Path, Any] = {}
+        await _prefetch(cls, path, documents)
+        token = _PREFETCHED.set(documents)
+        try:
+            # to_thread copies the current context, so the build sees the prefetched documents.
+            return await asyncio.to_thread(cls.model_validate, path)
+        finally:
+            _PREFETCHED.reset(token)
+
+    @classmethod
+    def from_trusted_path(cls, path: str | pathlib.Path) -> Self:
+        """Load the object from a trusted file path without validation.
+
+        Nested models, including objects referenced by further file paths, are built with `model_construct`, so no
+        validators run; see `verify_verse` for the footnote check. Use `model_validate` for files that may not conform
+        to the schema.
+        """
+        return _construct(cls, _load_json(pathlib.Path(path)))
 
 
 class Verse(pydantic.BaseModel):
     """A verse of scripture."""
 
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
+    # Pydantic stores fields in the instance __dict__, so the only slot that can be dropped is __weakref__.
+    __slots__ = ()
+
     text: str = pydantic.Field(description="The text of the verse.")
     footnotes: dict[str, str] | None = pydantic.Field(
         description="A dictionary of footnotes, where the key is the footnote reference and the value is the footnote"
@@ -41,25 +414,154 @@ class Verse(pydantic.BaseModel):
 
     @pydantic.model_validator(mode="after")
     def validate_footnotes(self) -> Self:
-        """Warn if a footnote key is not found in the verse text."""
-        if self.footnotes is None:
-            return self
-        for key in self.footnotes.keys():
-            if f"[^{key}]" not in self.text:
-                warnings.warn(f"Footnote key '{key}' not found in verse text.")
+        """Intern the footnote keys, and warn if a footnote key is not found in the verse text."""
+        if self.footnotes:
+            _intern_keys(self.footnotes)
+            verify_verse(self)
         return self
 
 
+def verify_verse(verse: Verse) -> None:
+    """Warn if a footnote key of a verse is not found in the verse text.
+
+    Validation runs this check for every verse. Verses built by the trusted load path skip it, so callers of that path
+    can run it once after loading instead.
+    """
+    if not verse.footnotes:
+        return
+    present = set(_FOOTNOTE_RE.findall(verse.text))
+    diagnostics = _DIAGNOSTICS.get()
+    for key in verse.footnotes.keys():
+        if key not in present:
+            message = f"Footnote key '{key}' not found in verse text."
+            if diagnostics is None:
+                warnings.warn(message)
+            else:
+                diagnostics.append(message)
+
+
+class VersesDict(collections.abc.Mapping[str, Verse]):
+    """A read-only mapping of verse numbers to verses that builds each `Verse` on first access.
+
+    The trusted load path stores the verses of a chapter this way, so that loading a book or volume for its titles and
+    headers does not build a `Verse` for every verse. Verses given as raw data are trusted and built with
+    `model_construct`. In a model, it is validated from and serialized to a JSON object, just like a `dict`, and
+    validation builds every verse up front.
+    """
+
+    __slots__ = ("_verses",)
+
+    def __init__(
+        self, verses: collections.abc.Mapping[str, Verse | dict[str, Any]] | None = None
+    ) -> None:
+        self._verses: dict[str, Verse | dict[str, Any]] = (
+            {} if verses is None else dict(verses)
+        )
+
+    def __getitem__(self, key: str) -> Verse:
+        verse = self._verses[key]
+        if not isinstance(verse, Verse):
+            verse = self._verses[key] = Verse.model_construct(**verse)
+        return verse
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._verses)
+
+    def __len__(self) -> int:
+        return len(self._verses)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: pydantic.GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return _mapping_schema(cls, Verse, handler)
+
+
 class Chapter(FilePathReferencable):
     """A chapter of scripture."""
 
     title: str | None = pydantic.Field(description="The title of the chapter.")
     header: str | None = pydantic.Field(description="The header of the chapter.")
-    verses: dict[str, Verse] = pydantic.Field(
+    verses: VersesDict = pydantic.Field(
         description="A dictionary of verses, where the key is the verse number and the value is the verse."
     )
 
 
+class ChapterSoA(pydantic.BaseModel):
+    """A chapter of scripture with its verses stored as parallel lists.
+
+    Storing the text of every verse in a single list is more compact than a dictionary of `Verse` objects and faster to
+    scan, e.g. for full-text search. Use `from_chapter` and `to_chapter` to convert to and from `Chapter`.
+    """
+
+    model_config = pydantic.ConfigDict(defer_build=True)
+
+    title: str | None = pydantic.Field(description="The title of the chapter.")
+    header: str | None = pydantic.Field(description="The header of the chapter.")
+    verse_ids: list[str] = pydantic.Field(description="The verse numbers, in order.")
+    verse_texts: list[str] = pydantic.Field(
+        description="The text of each verse, in the same order as `verse_ids`."
+    )
+    verse_footnotes: list[dict[str, str] | None] = pydantic.Field(
+        description="The footnotes of each verse, in the same order as `verse_ids`. See `Verse.footnotes`."
+    )
+    _verse_index: dict[str, int] | None = pydantic.PrivateAttr(default=None)
+
+    @pydantic.model_validator(mode="after")
+    def validate_lengths(self) -> Self:
+        """Check that the verse lists all have the same length."""
+        if (
+            not len(self.verse_ids)
+            == len(self.verse_texts)
+            == len(self.verse_footnotes)
+        ):
+            raise ValueError(
+                "verse_ids, verse_texts, and verse_footnotes must have the same length."
+            )
+        return self
+
+    @classmethod
+    def from_chapter(cls, chapter: Chapter) -> Self:
+        """Convert a chapter to the parallel list layout."""
+        verses = chapter.verses.values()
+        return cls.model_construct(
+            title=chapter.title,
+            header=chapter.header,
+            verse_ids=list(chapter.verses),
+            verse_texts=[verse.text for verse in verses],
+            verse_footnotes=[verse.footnotes for verse in verses],
+        )
+
+    def to_chapter(self) -> Chapter:
+        """Convert the chapter back to a `Chapter` with a dictionary of verses."""
+        return Chapter.model_construct(
+            title=self.title,
+            header=self.header,
+            verses=VersesDict(
+                {
+                    verse_id: Verse.model_construct(text=text, footnotes=footnotes)
+                    for verse_id, text, footnotes in zip(
+                        self.verse_ids, self.verse_texts, self.verse_footnotes
+                    )
+                }
+            ),
+        )
+
+    def verse(self, key: str) -> Verse:
+        """Get a verse by its verse number, building the `Verse` on demand."""
+        if self._verse_index is None:
+            self._verse_index = {
+                verse_id: index for index, verse_id in enumerate(self.verse_ids)
+            }
+        index = self._verse_index[key]
+        return Verse.model_construct(
+            text=self.verse_texts[index], footnotes=self.verse_footnotes[index]
+        )
+
+
 class Section(FilePathReferencable):
     """A section of scripture.
 
@@ -88,10 +590,10 @@ class Book(FilePathReferencable):
         description="The title of the book.",
         examples=["Genesis", "Exodus", "Leviticus", "Alma", "Doctrine and Covenants"],
     )
-    chapters: dict[str, Chapter] = pydantic.Field(
+    chapters: KeyedList[Chapter] = pydantic.Field(
         description="A dictionary of chapters, where the key is the chapter title and the value is the chapter."
     )
-    sections: dict[str, Section] | None = pydantic.Field(
+    sections: KeyedList[Section] | None = pydantic.Field(
         description="A dictionary of sections, where the key is the section title and the value is the section."
     )
     short_title: str | None = pydantic.Field(
@@ -122,6 +624,55 @@ class Book(FilePathReferencable):
         ),
     )
 
+    @classmethod
+    def load_from_directory(cls, root: str | pathlib.Path, **fields: Any) -> Self:
+        """Load a book whose chapters are stored as separate JSON files in a directory.
+
+        Each `.json` file in `root` is loaded as a chapter keyed by its file name without the extension, in natural
+        order so that chapter 2 comes before chapter 10. The files are read concurrently and loaded like any other file
+        path reference. The remaining fields of the book are given as keyword arguments; `title`, `sections`,
+        `short_title`, and `language` are required, and `chapters` may not be given.
+        """
+        if "chapters" in fields:
+            raise TypeError(
+                "The chapters of a book loaded from a directory cannot be given as a keyword argument."
+            )
+        missing = [
+            name
+            for name, field in cls.model_fields.items()
+            if field.is_required() and name != "chapters" and name not in fields
+        ]
+        if missing:
+            raise TypeError(
+                f"Missing required keyword arguments: {', '.join(missing)}."
+            )
+        paths = sorted(
+            (
+                entry.path
+                for entry in os.scandir(root)
+                if entry.is_file() and entry.name.endswith(".json")
+            ),
+            key=_natural_key,
+        )
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, Chapter.model_validate, path
+                )
+                for path in paths
+            ]
+            chapters = [future.result() for future in futures]
+        data = {
+            **fields,
+            "chapters": {
+                pathlib.Path(path).stem: chapter
+                for path, chapter in zip(paths, chapters)
+            },
+        }
+        if TRUSTED_LOAD:
+            return _construct(cls, data)
+        return cls.model_validate(data)
+
 
 class Volume(FilePathReferencable):
     """A volume of books.
@@ -139,7 +690,7 @@ class Volume(FilePathReferencable):
             "Pearl of Great Price",
         ],
     )
-    books: dict[str, Book] = pydantic.Field(
+    books: KeyedList[Book] = pydantic.Field(
         description="A dictionary of books, where the key is the book title and the value is the book."
     )
 
@@ -151,10 +702,12 @@ class Manifest(pydantic.BaseModel):
     high-level overview of the contents of the repository.
     """
 
-    volumes: dict[str, Volume] = pydantic.Field(
+    model_config = pydantic.ConfigDict(defer_build=True)
+
+    volumes: KeyedList[Volume] = pydantic.Field(
         description="A dictionary of volumes, where the key is the volume title and the value is the volume."
     )
-    books: dict[str, Book] = pydantic.Field(
+    books: KeyedList[Book] = pydantic.Field(
         description="A dictionary of books, where the key is the book title and the value is the book."
     )
     metadata: dict[str, str] | None = pydantic.Field(
@@ -164,3 +717,10 @@ class Manifest(pydantic.BaseModel):
             "metadata value."
         ),
     )
+
+
+# Every model defers building its schema so that each one is built exactly once, here, after all of the models it
+# references are defined, and in dependency order so that nested models reuse the schemas already built.
+for _model in (Verse, Chapter, ChapterSoA, Section, Book, Volume, Manifest):
+    _model.model_rebuild()
+del _model
@@ -0,0 +1,332 @@
+"""Tests for the Open Canon Schema model definitions."""
+
+import asyncio
+import json
+import os
+import pathlib
+import warnings
+
+import pydantic
+import pytest
+
+from open_canon_schema import model_definitions
+from open_canon_schema.model_definitions import (
+    Book,
+    Chapter,
+    ChapterSoA,
+    KeyedList,
+    Section,
+    Verse,
+    VersesDict,
+    Volume,
+    collect_diagnostics,
+)
+
+
+def _chapter() -> Chapter:
+    return Chapter(
+        title=None,
+        header=None,
+        verses={"1": Verse(text="In the beginning.", footnotes=None)},
+    )
+
+
+def test_keyed_list_serializes_plain_dict() -> None:
+    """A KeyedList field holding a plain dict, e.g. after model_construct or assignment, still serializes."""
+    chapter = _chapter()
+    book = Book.model_construct(
+        title="Genesis", chapters={"1": chapter}, sections=None, language="en"
+    )
+    assert (
+        book.model_dump_json(include={"chapters"})
+        == '{"chapters":{"1":' + chapter.model_dump_json() + "}}"
+    )
+    book.chapters = {"2": chapter}
+    assert book.model_dump(include={"chapters"}) == {
+        "chapters": {"2": chapter.model_dump()}
+    }
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"exclude": {"chapters": {"2"}}},
+        {"include": {"chapters": {"1": {"title"}}}},
+        {"exclude": {"chapters": {"__all__": {"verses"}}}},
+    ],
+)
+def test_keyed_list_nested_include_exclude(options: dict) -> None:
+    """Nested include and exclude apply to a KeyedList exactly as they do to a dict."""
+    chapters = {"1": _chapter(), "2": _chapter().model_copy(update={"title": "Two"})}
+    book = Book(
+        title="Genesis",
+        chapters=chapters,
+        sections=None,
+        short_title=None,
+        language="en",
+    )
+    DictBook = pydantic.create_model("DictBook", chapters=(dict[str, Chapter], ...))
+    dict_book = DictBook(chapters=chapters)
+    assert (
+        book.model_dump(**options)["chapters"]
+        == dict_book.model_dump(**options)["chapters"]
+    )
+    assert (
+        json.loads(book.model_dump_json(**options))["chapters"]
+        == json.loads(dict_book.model_dump_json(**options))["chapters"]
+    )
+
+
+def test_keyed_list_round_trip() -> None:
+    """A KeyedList validates from and serializes to a dict, preserving order."""
+    book = Book(
+        title="Genesis",
+        chapters={"2": _chapter(), "1": _chapter()},
+        sections=None,
+        short_title=None,
+        language="en",
+    )
+    assert isinstance(book.chapters, KeyedList)
+    assert list(book.chapters) == ["2", "1"]
+    assert Book.model_validate(book.model_dump()) == book
+
+
+def test_footnote_reference_after_unclosed_bracket() -> None:
+    """A footnote reference directly after an unclosed "[^" is still found."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        Verse(text="see [^a[^1] here", footnotes={"1": "A footnote."})
+
+
+def test_cached_path_reloads_when_size_changes(tmp_path) -> None:
+    """An edited file is reloaded even if its modification time is unchanged."""
+    path = tmp_path / "chapter.json"
+    path.write_text(_chapter().model_dump_json())
+    first = Chapter.model_validate(path)
+    assert Chapter.model_validate(path) is first
+    stat = path.stat()
+    path.write_text(
+        _chapter().model_copy(update={"title": "Chapter 1"}).model_dump_json()
+    )
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert Chapter.model_validate(path).title == "Chapter 1"
+
+
+def test_footnote_keys_are_interned() -> None:
+    """Equal footnote keys of different verses share a single string object."""
+    first, second = (
+        Verse(text="Text[^1a].", footnotes={"".join(["1", "a"]): "A footnote."})
+        for _ in range(2)
+    )
+    assert next(iter(first.footnotes)) is next(iter(second.footnotes))
+
+
+def test_collect_diagnostics_reports_cached_files(tmp_path) -> None:
+    """Files already in the cache are validated again while diagnostics are collected."""
+    path = tmp_path / "chapter.json"
+    path.write_text(
+        '{"title": null, "header": null, "verses": {"1": {"text": "Text.", "footnotes": {"1": "A"}}}}'
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        chapter = Chapter.model_validate(path)
+    message = "Footnote key '1' not found in verse text."
+    with collect_diagnostics() as diagnostics:
+        section = Section(title=None, header=None, chapters=[path, path])
+    assert diagnostics == [message]
+    assert section.chapters[0] is section.chapters[1] is not chapter
+
+
+def test_load_async_skips_cached_files(tmp_path, monkeypatch) -> None:
+    """load_async reads referenced files that are not cached, and only those."""
+    chapter_path = tmp_path / "chapter.json"
+    chapter_path.write_text(_chapter().model_dump_json())
+    section_path = tmp_path / "section.json"
+    section_path.write_text(
+        json.dumps({"title": None, "header": None, "chapters": [str(chapter_path)] * 2})
+    )
+    chapter = Chapter.model_validate(chapter_path)
+    read = []
+    read_json = model_definitions._read_json
+    monkeypatch.setattr(
+        model_definitions,
+        "_read_json",
+        lambda path: read.append(path) or read_json(path),
+    )
+    section = asyncio.run(Section.load_async(section_path))
+    assert read == [section_path]
+    assert section.chapters[0] is section.chapters[1] is chapter
+
+
+def test_trusted_chapter_builds_verses_on_access(tmp_path) -> None:
+    """The trusted load path stores verses as raw data until they are accessed."""
+    path = tmp_path / "chapter.json"
+    path.write_text(_chapter().model_dump_json())
+    chapter = Chapter.from_trusted_path(path)
+    assert isinstance(chapter.verses, VersesDict)
+    assert not isinstance(chapter.verses._verses["1"], Verse)
+    assert chapter.verses["1"] is chapter.verses["1"]
+    assert chapter.model_dump() == Chapter.model_validate(path).model_dump()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"exclude": {"verses": {"1"}}},
+        {"include": {"verses": {"2": {"text"}}}},
+        {"exclude": {"verses": {"__all__": {"footnotes"}}}},
+    ],
+)
+@pytest.mark.parametrize("trusted", [False, True])
+def test_verses_dict_nested_include_exclude(
+    tmp_path, options: dict, trusted: bool
+) -> None:
+    """Nested include and exclude apply to Chapter.verses exactly as they do to a dict."""
+    verses = {
+        "1": Verse(text="One.", footnotes=None),
+        "2": Verse(text="Two[^a].", footnotes={"a": "A footnote."}),
+    }
+    path = tmp_path / "chapter.json"
+    path.write_text(Chapter(title=None, header=None, verses=verses).model_dump_json())
+    chapter = (
+        Chapter.from_trusted_path(path) if trusted else Chapter.model_validate(path)
+    )
+    DictChapter = pydantic.create_model("DictChapter", verses=(dict[str, Verse], ...))
+    dict_chapter = DictChapter(verses=verses)
+    assert (
+        chapter.model_dump(**options)["verses"]
+        == dict_chapter.model_dump(**options)["verses"]
+    )
+    assert (
+        json.loads(chapter.model_dump_json(**options))["verses"]
+        == json.loads(dict_chapter.model_dump_json(**options))["verses"]
+    )
+
+
+def _write_volume(tmp_path) -> pathlib.Path:
+    """Write a volume whose book and chapters are all referenced by file path."""
+    chapter_paths = []
+    for number in ("1", "2"):
+        path = tmp_path / f"chapter{number}.json"
+        verses = {
+            "1": {"text": f"Verse of chapter {number}[^a].", "footnotes": {"a": "A"}}
+        }
+        path.write_text(json.dumps({"title": None, "header": None, "verses": verses}))
+        chapter_paths.append(str(path))
+    book_path = tmp_path / "book.json"
+    book_path.write_text(
+        json.dumps(
+            {
+                "title": "Genesis",
+                "chapters": dict(zip(("1", "2"), chapter_paths)),
+                "sections": {
+                    "s": {"title": None, "header": None, "chapters": chapter_paths}
+                },
+                "short_title": "Gen",
+                "language": "en",
+            }
+        )
+    )
+    volume_path = tmp_path / "volume.json"
+    volume_path.write_text(
+        json.dumps({"title": "Old Testament", "books": {"Genesis": str(book_path)}})
+    )
+    return volume_path
+
+
+def test_trusted_load_follows_file_references(tmp_path, monkeypatch) -> None:
+    """With TRUSTED_LOAD, model_validate builds a tree of referenced files without validation."""
+    volume_path = _write_volume(tmp_path)
+    validated = Volume.model_validate(volume_path)
+    monkeypatch.setattr(model_definitions, "TRUSTED_LOAD", True)
+    trusted = Volume.model_validate(volume_path)
+    book = trusted.books["Genesis"]
+    assert isinstance(trusted.books, KeyedList)
+    assert isinstance(book.chapters, KeyedList)
+    assert not isinstance(book.chapters["1"].verses._verses["1"], Verse)
+    assert book.sections["s"].chapters == [book.chapters["1"], book.chapters["2"]]
+    assert book.sections["s"].chapters[0] is book.chapters["1"]
+    assert trusted.model_dump() == validated.model_dump()
+    assert Volume.from_trusted_path(volume_path).model_dump() == validated.model_dump()
+
+
+def test_chapter_soa_round_trip() -> None:
+    """A chapter converts to the parallel list layout and back unchanged."""
+    chapter = Chapter(
+        title="Chapter 1",
+        header="The creation.",
+        verses={
+            "1": Verse(text="One.", footnotes=None),
+            "2": Verse(text="Two[^a].", footnotes={"a": "A footnote."}),
+        },
+    )
+    soa = ChapterSoA.from_chapter(chapter)
+    assert soa.verse_ids == ["1", "2"]
+    assert soa.verse_texts == ["One.", "Two[^a]."]
+    assert soa.verse_footnotes == [None, {"a": "A footnote."}]
+    assert soa.to_chapter().model_dump() == chapter.model_dump()
+
+
+def test_chapter_soa_verse() -> None:
+    """verse(key) builds a Verse on demand and raises KeyError for a missing verse."""
+    soa = ChapterSoA(
+        title=None,
+        header=None,
+        verse_ids=["1", "2"],
+        verse_texts=["One.", "Two."],
+        verse_footnotes=[None, None],
+    )
+    assert soa.verse("2") == Verse(text="Two.", footnotes=None)
+    with pytest.raises(KeyError):
+        soa.verse("3")
+
+
+def test_chapter_soa_rejects_different_lengths() -> None:
+    """The verse lists must all have the same length."""
+    with pytest.raises(pydantic.ValidationError, match="same length"):
+        ChapterSoA(
+            title=None,
+            header=None,
+            verse_ids=["1", "2"],
+            verse_texts=["One."],
+            verse_footnotes=[None, None],
+        )
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_load_from_directory(tmp_path, monkeypatch, trusted: bool) -> None:
+    """Chapter files are loaded in natural order and keyed by file name."""
+    for number in ("10", "2", "1"):
+        chapter = _chapter().model_copy(update={"title": f"Chapter {number}"})
+        (tmp_path / f"{number}.json").write_text(chapter.model_dump_json())
+    (tmp_path / "notes.txt").write_text("Not a chapter.")
+    monkeypatch.setattr(model_definitions, "TRUSTED_LOAD", trusted)
+    book = Book.load_from_directory(
+        tmp_path, title="Genesis", sections=None, short_title=None, language="en"
+    )
+    assert isinstance(book.chapters, KeyedList)
+    assert list(book.chapters) == ["1", "2", "10"]
+    assert [chapter.title for chapter in book.chapters.values()] == [
+        "Chapter 1",
+        "Chapter 2",
+        "Chapter 10",
+    ]
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_load_from_directory_rejects_bad_fields(
+    tmp_path, monkeypatch, trusted: bool
+) -> None:
+    """chapters may not be given, and the other required fields must be."""
+    monkeypatch.setattr(model_definitions, "TRUSTED_LOAD", trusted)
+    with pytest.raises(TypeError, match="chapters"):
+        Book.load_from_directory(
+            tmp_path,
+            title="Genesis",
+            chapters={},
+            sections=None,
+            short_title=None,
+            language="en",
+        )
+    with pytest.raises(TypeError, match="sections, short_title"):
+        Book.load_from_directory(tmp_path, title="Genesis", language="en")